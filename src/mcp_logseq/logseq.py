@@ -1,9 +1,126 @@
+import asyncio
+import functools
+import httpx
+import json
 import requests
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional speedup, see the "speedups" extra
+    ijson = None
 
 logger = logging.getLogger("mcp-logseq")
 
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def _children_from_tree(parent: str, tree: Any) -> List[Dict[str, Any]]:
+    """Normalize a children-tree API payload into a list of child blocks."""
+
+    if not tree:
+        return []
+
+    if isinstance(tree, dict):
+        return tree.get("children", []) or []
+
+    if isinstance(tree, list):
+        return tree
+
+    logger.warning("Unexpected children payload for parent %s: %r", parent, tree)
+    return []
+
+
+def _insert_options(
+    is_page_block: bool, before: bool, custom_uuid: str | None
+) -> Dict[str, Any]:
+    """Build insertBlock options, leaving out values that match the API defaults."""
+
+    options: Dict[str, Any] = {}
+    if is_page_block:
+        options["isPageBlock"] = True
+    if before:
+        options["before"] = True
+    if custom_uuid:
+        options["customUUID"] = custom_uuid
+    return options
+
+
+@functools.lru_cache(maxsize=None)
+def _envelope_prefix(method: str) -> bytes:
+    """Return the constant leading bytes of the request body for a method."""
+    return b'{"method":' + _dumps(method) + b',"args":'
+
+
+def _encode_call(method: str, args: list) -> bytes:
+    """Serialize a {method, args} API call, encoding only the arguments."""
+    return _envelope_prefix(method) + _dumps(args) + b'}'
+
+
+# Read results are cached briefly so repeated lookups skip the round trip
+_READ_CACHE_TTL = 5.0
+_READ_CACHE_MAXSIZE = 256
+
+# Methods that never modify the graph; any other method clears the read cache
+_READ_ONLY_METHODS = frozenset({
+    "logseq.Editor.getAllPages",
+    "logseq.Editor.getPage",
+    "logseq.Editor.getPageBlocksTree",
+    "logseq.Editor.getPageProperties",
+    "logseq.Editor.getBlock",
+    "logseq.Editor.getBlockChildrenTree",
+    "logseq.search",
+})
+
+# Read methods whose only argument is a page name
+_PAGE_READ_METHODS = (
+    "logseq.Editor.getPage",
+    "logseq.Editor.getPageBlocksTree",
+    "logseq.Editor.getPageProperties",
+)
+
+_MISSING = object()
+
+# Keys that may carry a block UUID in insert/get responses, in priority order
+_UUID_KEYS = ("uuid", "id")
+
+# Upper bound on connections kept per host, and on concurrent calls
+_POOL_MAXSIZE = 16
+
+# Transient failures are retried with exponential backoff. Plain 500s are
+# LogSeq method errors and read errors may mean the call was already applied,
+# so neither is retried.
+_RETRY = Retry(
+    total=3,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset(['POST']),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+
 class LogSeq():
     def __init__(
             self, 
@@ -12,6 +129,8 @@ class LogSeq():
             host: str = "127.0.0.1",
             port: int = 12315,
             verify_ssl: bool = False,
+            cache_ttl: float = _READ_CACHE_TTL,
+            trust_env: bool = False,
         ):
         self.api_key = api_key
         self.protocol = protocol
@@ -19,48 +138,157 @@ class LogSeq():
         self.port = port
         self.verify_ssl = verify_ssl
         self.timeout = (3, 6)
+        self.cache_ttl = cache_ttl
+        self._url = f'{protocol}://{host}:{port}/api'
+        self._headers = {'Authorization': f'Bearer {api_key}'}
+        self._read_cache: Dict[Tuple[str, str], Tuple[float, bytes]] = {}
+        self._cache_lock = threading.Lock()
+        # Bumped on every invalidation so reads that started before a write
+        # cannot cache what they fetched
+        self._cache_generation = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        # Reuse keep-alive connections to the LogSeq API across calls
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=_POOL_MAXSIZE, max_retries=_RETRY
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._session.verify = verify_ssl
+        # The API is normally served by the local desktop app, so skip the
+        # per-request proxy/netrc environment lookups unless asked for
+        self._session.trust_env = trust_env
+        self._session.headers.update(self._headers)
+        self._session.headers.update(_JSON_HEADERS)
+
+    def close(self) -> None:
+        """Release pooled connections and worker threads held by the client."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self._session.close()
+
+    def __enter__(self) -> "LogSeq":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def get_base_url(self) -> str:
-        return f'{self.protocol}://{self.host}:{self.port}/api'
+        return self._url
     
     def _get_headers(self) -> dict:
-        return {
-            'Authorization': f'Bearer {self.api_key}'
-        }
+        return self._headers
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=_POOL_MAXSIZE, thread_name_prefix="mcp-logseq"
+                    )
+        return self._executor
+
+    def invalidate(self, page_name: str | None = None) -> None:
+        """Drop cached read results.
+
+        With page_name only the cached lookups for that page (as passed to
+        get_page_content) are dropped; otherwise the whole cache is cleared.
+        """
+        with self._cache_lock:
+            self._cache_generation += 1
+            if page_name is None:
+                self._read_cache.clear()
+                return
+            args_key = repr([page_name])
+            for method in _PAGE_READ_METHODS:
+                self._read_cache.pop((method, args_key), None)
+
+    def _cache_get(self, key: Tuple[str, str]) -> Any:
+        """Return the cached response body for key, or _MISSING."""
+        with self._cache_lock:
+            entry = self._read_cache.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, content = entry
+            if expires_at < time.monotonic():
+                self._read_cache.pop(key, None)
+                return _MISSING
+            return content
+
+    def _cache_put(self, key: Tuple[str, str], content: bytes, generation: int) -> None:
+        """Cache a response body unless the cache was invalidated since generation."""
+        now = time.monotonic()
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return
+            if len(self._read_cache) >= _READ_CACHE_MAXSIZE:
+                for stale_key in [k for k, (exp, _) in self._read_cache.items() if exp < now]:
+                    del self._read_cache[stale_key]
+                if len(self._read_cache) >= _READ_CACHE_MAXSIZE:
+                    # Still full: evict the oldest entry
+                    del self._read_cache[next(iter(self._read_cache))]
+            self._read_cache[key] = (now + self.cache_ttl, content)
+
+    def _rpc(
+        self, method: str, args: list, *, cache: bool = False, decode: bool = True
+    ) -> Any:
+        """Invoke a single LogSeq API method and return the decoded result.
+
+        With cache=True a result for the same call from the last cache_ttl
+        seconds is returned without a request; cache_ttl=0 disables this.
+        Cached responses are decoded afresh on every hit, so callers may
+        modify the results they get. Methods that may modify the graph clear
+        the read cache once they complete. With decode=False the response
+        body is not parsed and None is returned.
+        """
+        cache = cache and self.cache_ttl > 0
+        write = not cache and method not in _READ_ONLY_METHODS
+        if cache:
+            key = (method, repr(args))
+            cached = self._cache_get(key)
+            if cached is not _MISSING:
+                return _loads(cached)
+            generation = self._cache_generation
+
+        try:
+            response = self._session.post(
+                self._url,
+                data=_encode_call(method, args),
+                timeout=self.timeout,
+            )
+            # Only build the HTTPError machinery when the call actually failed
+            if response.status_code >= 400:
+                response.raise_for_status()
+        finally:
+            if write:
+                # Invalidate after the write (even a failed one may have been
+                # applied) so reads that overlapped it are neither kept nor
+                # cached afterwards
+                self.invalidate()
+
+        if cache:
+            self._cache_put(key, response.content, generation)
+        if not decode:
+            return None
+        return _loads(response.content)
 
     def create_page(self, title: str, content: str = "") -> Any:
         """Create a new LogSeq page with specified title and content."""
-        url = self.get_base_url()
         logger.info(f"Creating page '{title}'")
         
         try:
             # Step 1: Create the page
-            response = requests.post(
-                url,
-                headers=self._get_headers(),
-                json={
-                    "method": "logseq.Editor.createPage",
-                    "args": [title, {}, {"createFirstBlock": True}]
-                },
-                verify=self.verify_ssl,
-                timeout=self.timeout
+            page_result = self._rpc(
+                "logseq.Editor.createPage", [title, {}, {"createFirstBlock": True}]
             )
-            response.raise_for_status()
-            page_result = response.json()
             
             # Step 2: Add content if provided
             if content and content.strip():
-                response = requests.post(
-                    url,
-                    headers=self._get_headers(),
-                    json={
-                        "method": "logseq.Editor.appendBlockInPage",
-                        "args": [title, content]
-                    },
-                    verify=self.verify_ssl,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
+                self._rpc("logseq.Editor.appendBlockInPage", [title, content])
             
             return page_result
 
@@ -70,22 +298,10 @@ class LogSeq():
             
     def list_pages(self) -> Any:
         """List all pages in the LogSeq graph."""
-        url = self.get_base_url()
         logger.info("Listing pages")
         
         try:
-            response = requests.post(
-                url,
-                headers=self._get_headers(),
-                json={
-                    "method": "logseq.Editor.getAllPages",
-                    "args": []
-                },
-                verify=self.verify_ssl,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._rpc("logseq.Editor.getAllPages", [], cache=True)
 
         except Exception as e:
             logger.error(f"Error listing pages: {str(e)}")
@@ -93,60 +309,29 @@ class LogSeq():
     
     def get_page_content(self, page_name: str) -> Any:
         """Get content of a LogSeq page including metadata and block content."""
-        url = self.get_base_url()
         logger.info(f"Getting content for page '{page_name}'")
         
         try:
-            # Step 1: Get page metadata (includes UUID)
-            response = requests.post(
-                url,
-                headers=self._get_headers(),
-                json={
-                    "method": "logseq.Editor.getPage",
-                    "args": [page_name]
-                },
-                verify=self.verify_ssl,
-                timeout=self.timeout
+            # Metadata, blocks and properties are independent lookups, so
+            # issue them concurrently rather than as three sequential trips
+            page_info, blocks, properties = self.batch(
+                [
+                    ("logseq.Editor.getPage", [page_name]),
+                    ("logseq.Editor.getPageBlocksTree", [page_name]),
+                    ("logseq.Editor.getPageProperties", [page_name]),
+                ],
+                concurrent=True,
+                cache=True,
             )
-            response.raise_for_status()
-            page_info = response.json()
             
             if not page_info:
                 logger.error(f"Page '{page_name}' not found")
                 return None
-                
-            # Step 2: Get page blocks using the page name
-            response = requests.post(
-                url,
-                headers=self._get_headers(),
-                json={
-                    "method": "logseq.Editor.getPageBlocksTree",
-                    "args": [page_name]
-                },
-                verify=self.verify_ssl,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            blocks = response.json()
-            
-            # Step 3: Get page properties
-            response = requests.post(
-                url,
-                headers=self._get_headers(),
-                json={
-                    "method": "logseq.Editor.getPageProperties",
-                    "args": [page_name]
-                },
-                verify=self.verify_ssl,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            properties = response.json() or {}
             
             return {
                 "page": {
                     **page_info,
-                    "properties": properties
+                    "properties": properties or {}
                 },
                 "blocks": blocks or []
             }
@@ -155,57 +340,82 @@ class LogSeq():
             logger.error(f"Error getting page content: {str(e)}")
             raise
 
+    def iter_page_blocks(self, page_name: str) -> Iterator[Dict[str, Any]]:
+        """Yield the top-level blocks of a page one at a time.
+
+        When ijson is installed the getPageBlocksTree response is parsed
+        incrementally, so the whole tree is never held in memory at once.
+        Otherwise the payload is decoded in one go and then iterated.
+        """
+        logger.info(f"Streaming blocks for page '{page_name}'")
+
+        try:
+            response = self._session.post(
+                self._url,
+                data=_encode_call("logseq.Editor.getPageBlocksTree", [page_name]),
+                timeout=self.timeout,
+                stream=True,
+            )
+            try:
+                if response.status_code >= 400:
+                    response.raise_for_status()
+                if ijson is None:
+                    yield from _loads(response.content) or []
+                else:
+                    response.raw.decode_content = True
+                    yield from ijson.items(response.raw, 'item', use_float=True)
+            finally:
+                response.close()
+
+        except Exception as e:
+            logger.error(f"Error streaming blocks for page '{page_name}': {str(e)}")
+            raise
+
     def search_content(self, query: str, options: dict = None) -> Any:
         """Search for content across LogSeq pages and blocks."""
-        url = self.get_base_url()
         logger.info(f"Searching for '{query}'")
         
         # Default search options
         search_options = options or {}
         
         try:
-            response = requests.post(
-                url,
-                headers=self._get_headers(),
-                json={
-                    "method": "logseq.search",
-                    "args": [query, search_options]
-                },
-                verify=self.verify_ssl,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._rpc("logseq.search", [query, search_options])
             
         except Exception as e:
             logger.error(f"Error searching content: {str(e)}")
             raise
-    
-    def delete_page(self, page_name: str) -> Any:
-        """Delete a LogSeq page by name."""
-        url = self.get_base_url()
+
+    def _page_exists(self, page_name: str) -> bool:
+        """Check whether a page exists, preferring a cached getPage lookup.
+
+        A cached hit is trusted, but a cached miss is re-checked against the
+        API since the page may have been created elsewhere in the meantime.
+        """
+        key = ("logseq.Editor.getPage", repr([page_name]))
+        if self.cache_ttl > 0:
+            cached = self._cache_get(key)
+            if cached is not _MISSING:
+                if _loads(cached):
+                    return True
+                # The cached miss may be stale; drop it and ask the API again
+                with self._cache_lock:
+                    self._read_cache.pop(key, None)
+        return bool(self._rpc("logseq.Editor.getPage", [page_name], cache=True))
+
+    def delete_page(self, page_name: str, *, validate: bool = True) -> Any:
+        """Delete a LogSeq page by name.
+
+        With validate=False the existence check is skipped and errors are left
+        to the LogSeq API.
+        """
         logger.info(f"Deleting page '{page_name}'")
 
         try:
             # Pre-delete validation: verify page exists
-            existing_pages = self.list_pages()
-            page_names = [p.get("originalName") or p.get("name") for p in existing_pages if p.get("originalName") or p.get("name")]
-            
-            if page_name not in page_names:
+            if validate and not self._page_exists(page_name):
                 raise ValueError(f"Page '{page_name}' does not exist")
             
-            response = requests.post(
-                url,
-                headers=self._get_headers(),
-                json={
-                    "method": "logseq.Editor.deletePage",
-                    "args": [page_name]
-                },
-                verify=self.verify_ssl,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            result = response.json()
+            result = self._rpc("logseq.Editor.deletePage", [page_name])
             logger.info(f"Successfully deleted page '{page_name}'")
             return result
 
@@ -216,17 +426,24 @@ class LogSeq():
             logger.error(f"Error deleting page '{page_name}': {str(e)}")
             raise
     
-    def update_page(self, page_name: str, content: str = None, properties: dict = None) -> Any:
-        """Update a LogSeq page with new content and/or properties."""
-        url = self.get_base_url()
+    def update_page(
+        self,
+        page_name: str,
+        content: str = None,
+        properties: dict = None,
+        *,
+        validate: bool = True,
+    ) -> Any:
+        """Update a LogSeq page with new content and/or properties.
+
+        With validate=False the existence check is skipped and errors are left
+        to the LogSeq API.
+        """
         logger.info(f"Updating page '{page_name}'")
         
         try:
             # Pre-update validation: verify page exists
-            existing_pages = self.list_pages()
-            page_names = [p.get("originalName") or p.get("name") for p in existing_pages if p.get("originalName") or p.get("name")]
-            
-            if page_name not in page_names:
+            if validate and not self._page_exists(page_name):
                 raise ValueError(f"Page '{page_name}' does not exist")
             
             results = []
@@ -235,55 +452,27 @@ class LogSeq():
             if properties:
                 logger.debug(f"Updating properties for page '{page_name}': {properties}")
                 try:
-                    response = requests.post(
-                        url,
-                        headers=self._get_headers(),
-                        json={
-                            "method": "logseq.Editor.updatePage",
-                            "args": [page_name, properties]
-                        },
-                        verify=self.verify_ssl,
-                        timeout=self.timeout
+                    prop_result = self._rpc(
+                        "logseq.Editor.updatePage", [page_name, properties]
                     )
-                    response.raise_for_status()
-                    prop_result = response.json()
                     results.append(("properties", prop_result))
                 except Exception as e:
                     logger.warning(f"Failed to update properties with updatePage, trying setPageProperties: {str(e)}")
                     # Fallback to setPageProperties
-                    response = requests.post(
-                        url,
-                        headers=self._get_headers(),
-                        json={
-                            "method": "logseq.Editor.setPageProperties",
-                            "args": [page_name, properties]
-                        },
-                        verify=self.verify_ssl,
-                        timeout=self.timeout
+                    prop_result = self._rpc(
+                        "logseq.Editor.setPageProperties", [page_name, properties]
                     )
-                    response.raise_for_status()
-                    prop_result = response.json()
                     results.append(("properties_fallback", prop_result))
             
-            # Update content if provided
+            # Update content if provided. Properties live in the page's first
+            # block, so they are written before any content is appended.
             if content is not None:
                 logger.debug(f"Updating content for page '{page_name}'")
-                # Strategy: Get existing blocks and update them, or add new content
                 # For now, we'll use appendBlockInPage to add new content
                 # TODO: In future, implement block-level updates for more sophisticated content management
-                
-                response = requests.post(
-                    url,
-                    headers=self._get_headers(),
-                    json={
-                        "method": "logseq.Editor.appendBlockInPage",
-                        "args": [page_name, content]
-                    },
-                    verify=self.verify_ssl,
-                    timeout=self.timeout
+                content_result = self._rpc(
+                    "logseq.Editor.appendBlockInPage", [page_name, content]
                 )
-                response.raise_for_status()
-                content_result = response.json()
                 results.append(("content", content_result))
             
             logger.info(f"Successfully updated page '{page_name}'")
@@ -296,6 +485,47 @@ class LogSeq():
             logger.error(f"Error updating page '{page_name}': {str(e)}")
             raise
 
+    def batch(
+        self,
+        calls: List[Tuple[str, list]],
+        *,
+        concurrent: bool = False,
+        cache: bool = False,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Run several LogSeq API calls and return their results in call order.
+
+        The LogSeq HTTP API accepts a single {method, args} object per request,
+        so the calls are sent back to back over the session's keep-alive
+        connection. With concurrent=True the calls are instead dispatched in
+        parallel over the connection pool; only use this for calls that do not
+        depend on each other's effects. cache applies to every call as in
+        _rpc(). With return_exceptions, a failing call yields its exception in
+        place of a result instead of aborting the remaining calls.
+        """
+        results: List[Any] = []
+        futures = None
+        if concurrent and len(calls) > 1:
+            executor = self._get_executor()
+            futures = [
+                executor.submit(self._rpc, method, args, cache=cache)
+                for method, args in calls
+            ]
+
+        for i, (method, args) in enumerate(calls):
+            try:
+                if futures is not None:
+                    results.append(futures[i].result())
+                else:
+                    results.append(self._rpc(method, args, cache=cache))
+            except Exception as e:
+                if not return_exceptions:
+                    logger.error("Error running batched %s: %s", method, str(e))
+                    raise
+                results.append(e)
+
+        return results
+
     # ------------------------------------------------------------------
     # Block-level operations
 
@@ -310,7 +540,6 @@ class LogSeq():
     ) -> Any:
         """Insert a new block via logseq.Editor.insertBlock."""
 
-        url = self.get_base_url()
         logger.info(
             "Inserting block under %s (is_page_block=%s, before=%s)",
             parent_block,
@@ -318,35 +547,95 @@ class LogSeq():
             before,
         )
 
-        options = {
-            "isPageBlock": is_page_block,
-            "before": before,
-            "customUUID": custom_uuid,
-        }
+        options = _insert_options(is_page_block, before, custom_uuid)
 
         try:
-            response = requests.post(
-                url,
-                headers=self._get_headers(),
-                json={
-                    "method": "logseq.Editor.insertBlock",
-                    "args": [parent_block, content, options],
-                },
-                verify=self.verify_ssl,
-                timeout=self.timeout,
+            result = self._rpc(
+                "logseq.Editor.insertBlock", [parent_block, content, options]
             )
-            response.raise_for_status()
-            result = response.json()
             logger.debug("insert_block result: %s", result)
             return result
         except Exception as e:
             logger.error("Error inserting block: %s", str(e))
             raise
 
-    def update_block(self, block_uuid: str, content: str, pos: int | None = None) -> Any:
-        """Update an existing block via logseq.Editor.updateBlock."""
+    def insert_blocks(self, items: List[Dict[str, Any]]) -> List[Any]:
+        """Insert several blocks in one batch.
+
+        Each item takes the insert_block arguments as keys: ``parent_block``,
+        ``content`` and optionally ``is_page_block``, ``before`` and
+        ``custom_uuid``. Results are returned in item order.
+        """
+
+        logger.info("Inserting %d blocks", len(items))
+
+        calls = [
+            (
+                "logseq.Editor.insertBlock",
+                [
+                    item.get("parent_block"),
+                    item["content"],
+                    _insert_options(
+                        item.get("is_page_block", False),
+                        item.get("before", False),
+                        item.get("custom_uuid"),
+                    ),
+                ],
+            )
+            for item in items
+        ]
+        return self.batch(calls)
+
+    def insert_batch_block(
+        self,
+        parent_block: str,
+        blocks: List[Dict[str, Any]],
+        *,
+        sibling: bool = False,
+        before: bool = False,
+    ) -> Any:
+        """Insert a block tree in one call via logseq.Editor.insertBatchBlock.
+
+        ``blocks`` uses the same nested ``content``/``children``/``custom_uuid``
+        definitions as replace_children. The raw API result is returned; it is
+        null on some LogSeq builds and a flat list of every inserted block on
+        others. Without sibling the blocks go before any existing children.
+        """
+
+        logger.info(
+            "Batch inserting %d blocks under %s (sibling=%s, before=%s)",
+            len(blocks),
+            parent_block,
+            sibling,
+            before,
+        )
+
+        batch_blocks = [self._to_batch_block(block) for block in blocks]
+        options = {"sibling": sibling, "before": before, "keepUUID": True}
+
+        try:
+            result = self._rpc(
+                "logseq.Editor.insertBatchBlock", [parent_block, batch_blocks, options]
+            )
+            logger.debug("insert_batch_block result: %s", result)
+            return result
+        except Exception as e:
+            logger.error("Error batch inserting blocks: %s", str(e))
+            raise
+
+    def update_block(
+        self,
+        block_uuid: str,
+        content: str,
+        pos: int | None = None,
+        *,
+        decode: bool = True,
+    ) -> Any:
+        """Update an existing block via logseq.Editor.updateBlock.
+
+        With decode=False the API response is discarded and None is returned.
+        """
 
-        url = self.get_base_url()
         logger.info("Updating block %s", block_uuid)
 
         payload = {"content": content}
@@ -354,43 +643,27 @@ class LogSeq():
             payload["pos"] = pos
 
         try:
-            response = requests.post(
-                url,
-                headers=self._get_headers(),
-                json={
-                    "method": "logseq.Editor.updateBlock",
-                    "args": [block_uuid, payload],
-                },
-                verify=self.verify_ssl,
-                timeout=self.timeout,
+            result = self._rpc(
+                "logseq.Editor.updateBlock", [block_uuid, payload], decode=decode
             )
-            response.raise_for_status()
-            result = response.json()
             logger.debug("update_block result: %s", result)
             return result
         except Exception as e:
             logger.error("Error updating block %s: %s", block_uuid, str(e))
             raise
 
-    def delete_block(self, block_uuid: str) -> Any:
-        """Delete a block via logseq.Editor.removeBlock."""
+    def delete_block(self, block_uuid: str, *, decode: bool = True) -> Any:
+        """Delete a block via logseq.Editor.removeBlock.
+
+        With decode=False the API response is discarded and None is returned.
+        """
 
-        url = self.get_base_url()
         logger.info("Removing block %s", block_uuid)
 
         try:
-            response = requests.post(
-                url,
-                headers=self._get_headers(),
-                json={
-                    "method": "logseq.Editor.removeBlock",
-                    "args": [block_uuid],
-                },
-                verify=self.verify_ssl,
-                timeout=self.timeout,
+            result = self._rpc(
+                "logseq.Editor.removeBlock", [block_uuid], decode=decode
             )
-            response.raise_for_status()
-            result = response.json()
             logger.debug("delete_block result: %s", result)
             return result
         except Exception as e:
@@ -400,24 +673,16 @@ class LogSeq():
     def get_block(self, block_uuid: str, include_children: bool = False) -> Any:
         """Fetch block details via logseq.Editor.getBlock."""
 
-        url = self.get_base_url()
         logger.info(
             "Fetching block %s (include_children=%s)", block_uuid, include_children
         )
 
         try:
-            response = requests.post(
-                url,
-                headers=self._get_headers(),
-                json={
-                    "method": "logseq.Editor.getBlock",
-                    "args": [block_uuid, {"includeChildren": include_children}],
-                },
-                verify=self.verify_ssl,
-                timeout=self.timeout,
+            result = self._rpc(
+                "logseq.Editor.getBlock",
+                [block_uuid, {"includeChildren": include_children}],
+                cache=True,
             )
-            response.raise_for_status()
-            result = response.json()
             logger.debug("get_block result: %s", result)
             return result
         except Exception as e:
@@ -427,54 +692,64 @@ class LogSeq():
     # ------------------------------------------------------------------
     # Higher-level helpers for batch operations
 
-    def _extract_block_uuid(self, result: Any) -> Optional[str]:
+    @staticmethod
+    def _extract_block_uuid(result: Any) -> Optional[str]:
         """Best-effort attempt to derive a block UUID from various API responses."""
 
-        if isinstance(result, str):
+        result_type = type(result)
+        if result_type is str:
             return result
+        if result_type is not dict:
+            return None
 
-        if isinstance(result, dict):
-            for key in ("uuid", "id"):
-                value = result.get(key)
-                if isinstance(value, str):
-                    return value
+        for key in _UUID_KEYS:
+            value = result.get(key)
+            if type(value) is str:
+                return value
 
-            block = result.get("block")
-            if isinstance(block, dict):
-                for key in ("uuid", "id"):
-                    value = block.get(key)
-                    if isinstance(value, str):
-                        return value
+        block = result.get("block")
+        if type(block) is dict:
+            for key in _UUID_KEYS:
+                value = block.get(key)
+                if type(value) is str:
+                    return value
 
         return None
 
-    def _get_children_tree(self, parent: str, *, is_page: bool) -> List[Dict[str, Any]]:
-        """Return the children tree for a page or block."""
+    @staticmethod
+    def _to_batch_block(block_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Translate a block definition into LogSeq's IBatchBlock shape."""
 
-        url = self.get_base_url()
-        method = "logseq.Editor.getPageBlocksTree" if is_page else "logseq.Editor.getBlockChildrenTree"
+        if "content" not in block_data:
+            raise ValueError("Each block definition must include a 'content' field.")
 
-        response = requests.post(
-            url,
-            headers=self._get_headers(),
-            json={"method": method, "args": [parent]},
-            verify=self.verify_ssl,
-            timeout=self.timeout,
-        )
-        response.raise_for_status()
-        tree = response.json()
+        batch_block: Dict[str, Any] = {"content": block_data["content"]}
 
-        if not tree:
-            return []
+        # insertBatchBlock takes custom UUIDs as the block's id property
+        custom_uuid = block_data.get("custom_uuid")
+        if custom_uuid:
+            batch_block["properties"] = {"id": custom_uuid}
 
-        if isinstance(tree, dict):
-            return tree.get("children", []) or []
+        children = block_data.get("children", []) or []
+        if children:
+            batch_block["children"] = [LogSeq._to_batch_block(child) for child in children]
 
-        if isinstance(tree, list):
-            return tree
+        return batch_block
 
-        logger.warning("Unexpected children payload for parent %s: %r", parent, tree)
-        return []
+    def _get_children_tree(self, parent: str, *, is_page: bool) -> List[Dict[str, Any]]:
+        """Return the children tree for a page or block."""
+
+        method = "logseq.Editor.getPageBlocksTree" if is_page else "logseq.Editor.getBlockChildrenTree"
+        return _children_from_tree(parent, self._rpc(method, [parent]))
+
+    def _child_uuids(self, parent: str, *, is_page: bool) -> List[str]:
+        """Return the UUIDs of the top-level children of a page or block, in order."""
+
+        return [
+            child["uuid"]
+            for child in self._get_children_tree(parent, is_page=is_page)
+            if isinstance(child.get("uuid"), str)
+        ]
 
     def _insert_block_tree(
         self,
@@ -483,27 +758,43 @@ class LogSeq():
         *,
         is_page_block: bool,
     ) -> Optional[str]:
-        """Insert a block (and its subtree) under the given parent."""
+        """Insert a block (and its subtree) under the given parent.
 
-        if "content" not in block_data:
-            raise ValueError("Each block definition must include a 'content' field.")
+        The tree is walked with an explicit stack in the same depth-first order
+        as a recursive insert: each block is followed by its subtree, and
+        siblings keep their order. Returns the UUID of the top-level block.
+        """
 
-        result = self.insert_block(
-            parent,
-            block_data["content"],
-            is_page_block=is_page_block,
-            custom_uuid=block_data.get("custom_uuid"),
-        )
+        insert_block = self.insert_block
+        extract_uuid = self._extract_block_uuid
 
-        new_uuid = self._extract_block_uuid(result)
-        if new_uuid is None:
-            logger.warning("Could not determine UUID for inserted block under %s", parent)
-            return None
+        root_uuid: Optional[str] = None
+        stack = [(parent, block_data, is_page_block)]
+
+        while stack:
+            parent_uuid, data, page_block = stack.pop()
+
+            if "content" not in data:
+                raise ValueError("Each block definition must include a 'content' field.")
+
+            result = insert_block(
+                parent_uuid,
+                data["content"],
+                is_page_block=page_block,
+                custom_uuid=data.get("custom_uuid"),
+            )
+
+            new_uuid = extract_uuid(result)
+            if data is block_data:
+                root_uuid = new_uuid
+            if new_uuid is None:
+                logger.warning("Could not determine UUID for inserted block under %s", parent_uuid)
+                continue
 
-        for child in block_data.get("children", []) or []:
-            self._insert_block_tree(new_uuid, child, is_page_block=False)
+            children = data.get("children", []) or []
+            stack.extend((new_uuid, child, False) for child in reversed(children))
 
-        return new_uuid
+        return root_uuid
 
     def replace_children(
         self,
@@ -523,17 +814,435 @@ class LogSeq():
         )
 
         inserted: List[str] = []
+        remaining_uuids: List[str] = []
 
-        if delete_existing:
-            existing_children = self._get_children_tree(parent, is_page=is_page)
-            for child in reversed(existing_children):
-                uuid = child.get("uuid")
-                if isinstance(uuid, str):
-                    self.delete_block(uuid)
+        if delete_existing or not is_page:
+            child_uuids = self._child_uuids(parent, is_page=is_page)
+            if delete_existing:
+                # Removing siblings is order-independent, so run the deletes in
+                # parallel over the connection pool; their responses are unused
+                delete_block = functools.partial(self.delete_block, decode=False)
+                list(self._get_executor().map(delete_block, child_uuids))
+            else:
+                remaining_uuids = child_uuids
+
+        if not blocks:
+            return inserted
 
+        # insertBatchBlock needs a block to insert under, so it can only
+        # create the whole tree in one call when the parent is a block
+        if not is_page:
+            # Without sibling, insertBatchBlock puts the blocks before any
+            # existing children; anchor after the last one instead so blocks
+            # are appended, as the per-block inserts below do
+            if remaining_uuids:
+                target, sibling = remaining_uuids[-1], True
+            else:
+                target, sibling = parent, False
+            try:
+                self.insert_batch_block(target, blocks, sibling=sibling)
+            except requests.exceptions.HTTPError as e:
+                # Only fall back when this LogSeq build lacks the method (404
+                # MethodNotExist). insertBatchBlock is all-or-nothing, so redoing
+                # other failures block by block could leave half a tree behind.
+                if e.response is None or e.response.status_code != 404:
+                    raise
+                logger.warning(
+                    "insertBatchBlock not available under %s, inserting blocks individually: %s",
+                    parent,
+                    str(e),
+                )
+            else:
+                # The response is null on some LogSeq builds and lists every
+                # inserted block (not just the roots) on others, so read the
+                # new top-level blocks back from the parent instead
+                existing = set(remaining_uuids)
+                return [
+                    uuid
+                    for uuid in self._child_uuids(parent, is_page=False)
+                    if uuid not in existing
+                ]
+
+        # Inserts stay sequential: each one appends under the parent, so
+        # sibling order depends on the order the calls complete
         for block in blocks:
             new_uuid = self._insert_block_tree(parent, block, is_page_block=is_page)
             if new_uuid:
                 inserted.append(new_uuid)
 
         return inserted
+
+
+class AsyncLogSeq():
+    """Asynchronous counterpart of LogSeq built on httpx.AsyncClient.
+
+    Independent calls can be awaited concurrently (e.g. with asyncio.gather)
+    over the client's shared connection pool. With http2=True (requires the
+    "http2" extra) concurrent calls are multiplexed over one connection when
+    the server negotiates HTTP/2, which needs an https endpoint.
+    """
+
+    def __init__(
+            self,
+            api_key: str,
+            protocol: str = 'http',
+            host: str = "127.0.0.1",
+            port: int = 12315,
+            verify_ssl: bool = False,
+            http2: bool = False,
+        ):
+        self.api_key = api_key
+        self.protocol = protocol
+        self.host = host
+        self.port = port
+        self.verify_ssl = verify_ssl
+        self.http2 = http2
+        self._client = httpx.AsyncClient(
+            base_url=f'{protocol}://{host}:{port}',
+            headers={'Authorization': f'Bearer {api_key}', **_JSON_HEADERS},
+            verify=verify_ssl,
+            http2=http2,
+            timeout=httpx.Timeout(6.0, connect=3.0),
+            limits=httpx.Limits(
+                max_connections=20, max_keepalive_connections=_POOL_MAXSIZE
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Release pooled connections held by the underlying client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncLogSeq":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _rpc(self, method: str, args: list, *, decode: bool = True) -> Any:
+        """Invoke a single LogSeq API method and return the decoded result.
+
+        With decode=False the response body is not parsed and None is returned.
+        """
+        response = await self._client.post(
+            '/api', content=_encode_call(method, args)
+        )
+        # httpx treats any non-2xx final response as an error
+        if response.status_code >= 300:
+            response.raise_for_status()
+        if not decode:
+            return None
+        return _loads(response.content)
+
+    async def create_page(self, title: str, content: str = "") -> Any:
+        """Create a new LogSeq page with specified title and content."""
+        logger.info(f"Creating page '{title}'")
+
+        try:
+            page_result = await self._rpc(
+                "logseq.Editor.createPage", [title, {}, {"createFirstBlock": True}]
+            )
+            if content and content.strip():
+                await self._rpc("logseq.Editor.appendBlockInPage", [title, content])
+            return page_result
+
+        except Exception as e:
+            logger.error(f"Error creating page: {str(e)}")
+            raise
+
+    async def list_pages(self) -> Any:
+        """List all pages in the LogSeq graph."""
+        logger.info("Listing pages")
+
+        try:
+            return await self._rpc("logseq.Editor.getAllPages", [])
+        except Exception as e:
+            logger.error(f"Error listing pages: {str(e)}")
+            raise
+
+    async def get_page_content(self, page_name: str) -> Any:
+        """Get content of a LogSeq page including metadata and block content."""
+        logger.info(f"Getting content for page '{page_name}'")
+
+        try:
+            # The three lookups are independent, so issue them concurrently
+            page_info, blocks, properties = await asyncio.gather(
+                self._rpc("logseq.Editor.getPage", [page_name]),
+                self._rpc("logseq.Editor.getPageBlocksTree", [page_name]),
+                self._rpc("logseq.Editor.getPageProperties", [page_name]),
+            )
+
+            if not page_info:
+                logger.error(f"Page '{page_name}' not found")
+                return None
+
+            return {
+                "page": {
+                    **page_info,
+                    "properties": properties or {}
+                },
+                "blocks": blocks or []
+            }
+
+        except Exception as e:
+            logger.error(f"Error getting page content: {str(e)}")
+            raise
+
+    async def search_content(self, query: str, options: dict = None) -> Any:
+        """Search for content across LogSeq pages and blocks."""
+        logger.info(f"Searching for '{query}'")
+
+        try:
+            return await self._rpc("logseq.search", [query, options or {}])
+        except Exception as e:
+            logger.error(f"Error searching content: {str(e)}")
+            raise
+
+    async def _page_exists(self, page_name: str) -> bool:
+        """Check whether a page exists with a single getPage lookup."""
+        return bool(await self._rpc("logseq.Editor.getPage", [page_name]))
+
+    async def delete_page(self, page_name: str, *, validate: bool = True) -> Any:
+        """Delete a LogSeq page by name."""
+        logger.info(f"Deleting page '{page_name}'")
+
+        try:
+            if validate and not await self._page_exists(page_name):
+                raise ValueError(f"Page '{page_name}' does not exist")
+            result = await self._rpc("logseq.Editor.deletePage", [page_name])
+            logger.info(f"Successfully deleted page '{page_name}'")
+            return result
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error deleting page '{page_name}': {str(e)}")
+            raise
+
+    async def update_page(
+        self,
+        page_name: str,
+        content: str = None,
+        properties: dict = None,
+        *,
+        validate: bool = True,
+    ) -> Any:
+        """Update a LogSeq page with new content and/or properties."""
+        logger.info(f"Updating page '{page_name}'")
+
+        try:
+            if validate and not await self._page_exists(page_name):
+                raise ValueError(f"Page '{page_name}' does not exist")
+
+            results = []
+
+            if properties:
+                try:
+                    prop_result = await self._rpc(
+                        "logseq.Editor.updatePage", [page_name, properties]
+                    )
+                    results.append(("properties", prop_result))
+                except Exception as e:
+                    logger.warning(f"Failed to update properties with updatePage, trying setPageProperties: {str(e)}")
+                    prop_result = await self._rpc(
+                        "logseq.Editor.setPageProperties", [page_name, properties]
+                    )
+                    results.append(("properties_fallback", prop_result))
+
+            if content is not None:
+                content_result = await self._rpc(
+                    "logseq.Editor.appendBlockInPage", [page_name, content]
+                )
+                results.append(("content", content_result))
+
+            logger.info(f"Successfully updated page '{page_name}'")
+            return {"updates": results, "page": page_name}
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error updating page '{page_name}': {str(e)}")
+            raise
+
+    # ------------------------------------------------------------------
+    # Block-level operations
+
+    async def insert_block(
+        self,
+        parent_block: str | None,
+        content: str,
+        *,
+        is_page_block: bool = False,
+        before: bool = False,
+        custom_uuid: str | None = None,
+    ) -> Any:
+        """Insert a new block via logseq.Editor.insertBlock."""
+
+        logger.info(
+            "Inserting block under %s (is_page_block=%s, before=%s)",
+            parent_block,
+            is_page_block,
+            before,
+        )
+
+        options = _insert_options(is_page_block, before, custom_uuid)
+
+        try:
+            result = await self._rpc(
+                "logseq.Editor.insertBlock", [parent_block, content, options]
+            )
+            logger.debug("insert_block result: %s", result)
+            return result
+        except Exception as e:
+            logger.error("Error inserting block: %s", str(e))
+            raise
+
+    async def update_block(
+        self,
+        block_uuid: str,
+        content: str,
+        pos: int | None = None,
+        *,
+        decode: bool = True,
+    ) -> Any:
+        """Update an existing block via logseq.Editor.updateBlock.
+
+        With decode=False the API response is discarded and None is returned.
+        """
+
+        logger.info("Updating block %s", block_uuid)
+
+        payload = {"content": content}
+        if pos is not None:
+            payload["pos"] = pos
+
+        try:
+            result = await self._rpc(
+                "logseq.Editor.updateBlock", [block_uuid, payload], decode=decode
+            )
+            logger.debug("update_block result: %s", result)
+            return result
+        except Exception as e:
+            logger.error("Error updating block %s: %s", block_uuid, str(e))
+            raise
+
+    async def delete_block(self, block_uuid: str, *, decode: bool = True) -> Any:
+        """Delete a block via logseq.Editor.removeBlock.
+
+        With decode=False the API response is discarded and None is returned.
+        """
+
+        logger.info("Removing block %s", block_uuid)
+
+        try:
+            result = await self._rpc(
+                "logseq.Editor.removeBlock", [block_uuid], decode=decode
+            )
+            logger.debug("delete_block result: %s", result)
+            return result
+        except Exception as e:
+            logger.error("Error deleting block %s: %s", block_uuid, str(e))
+            raise
+
+    async def get_block(self, block_uuid: str, include_children: bool = False) -> Any:
+        """Fetch block details via logseq.Editor.getBlock."""
+
+        logger.info(
+            "Fetching block %s (include_children=%s)", block_uuid, include_children
+        )
+
+        try:
+            result = await self._rpc(
+                "logseq.Editor.getBlock",
+                [block_uuid, {"includeChildren": include_children}],
+            )
+            logger.debug("get_block result: %s", result)
+            return result
+        except Exception as e:
+            logger.error("Error fetching block %s: %s", block_uuid, str(e))
+            raise
+
+    # ------------------------------------------------------------------
+    # Higher-level helpers for batch operations
+
+    async def _get_children_tree(self, parent: str, *, is_page: bool) -> List[Dict[str, Any]]:
+        """Return the children tree for a page or block."""
+
+        method = "logseq.Editor.getPageBlocksTree" if is_page else "logseq.Editor.getBlockChildrenTree"
+        return _children_from_tree(parent, await self._rpc(method, [parent]))
+
+    async def _insert_siblings(
+        self,
+        parent: str,
+        blocks: List[Dict[str, Any]],
+        *,
+        is_page_block: bool,
+    ) -> List[Optional[str]]:
+        """Insert sibling blocks (and their subtrees) under the given parent.
+
+        Siblings are created one after another to keep their order. Once a
+        block exists its children hang off a different parent, so each subtree
+        is filled in concurrently with the remaining siblings.
+        """
+
+        uuids: List[Optional[str]] = []
+        subtrees: List[asyncio.Task] = []
+
+        try:
+            for block_data in blocks:
+                if "content" not in block_data:
+                    raise ValueError("Each block definition must include a 'content' field.")
+
+                result = await self.insert_block(
+                    parent,
+                    block_data["content"],
+                    is_page_block=is_page_block,
+                    custom_uuid=block_data.get("custom_uuid"),
+                )
+
+                new_uuid = LogSeq._extract_block_uuid(result)
+                uuids.append(new_uuid)
+                if new_uuid is None:
+                    logger.warning("Could not determine UUID for inserted block under %s", parent)
+                    continue
+
+                children = block_data.get("children", []) or []
+                if children:
+                    subtrees.append(asyncio.create_task(
+                        self._insert_siblings(new_uuid, children, is_page_block=False)
+                    ))
+
+            await asyncio.gather(*subtrees)
+        except BaseException:
+            for task in subtrees:
+                task.cancel()
+            raise
+
+        return uuids
+
+    async def replace_children(
+        self,
+        parent: str,
+        blocks: List[Dict[str, Any]],
+        *,
+        is_page: bool = False,
+        delete_existing: bool = True,
+    ) -> List[str]:
+        """Replace the children of a page or block with a provided block tree."""
+
+        logger.info(
+            "Replacing children under %s (is_page=%s, delete_existing=%s)",
+            parent,
+            is_page,
+            delete_existing,
+        )
+
+        if delete_existing:
+            existing_children = await self._get_children_tree(parent, is_page=is_page)
+            await asyncio.gather(*(
+                self.delete_block(child["uuid"], decode=False)
+                for child in existing_children
+                if isinstance(child.get("uuid"), str)
+            ))
+
+        new_uuids = await self._insert_siblings(parent, blocks, is_page_block=is_page)
+        return [uuid for uuid in new_uuids if uuid]
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import sys
@@ -89,7 +90,7 @@ logger.info("Tool handlers registration complete")
 async def list_tools() -> list[Tool]:
     """List available tools."""
     logger.debug("Listing tools")
-    tools_list = [th.get_tool_description() for th in tool_handlers.values()]
+    tools_list = [th.tool for th in tool_handlers.values()]
     logger.debug(f"Found {len(tools_list)} tools")
     return tools_list
 
@@ -109,7 +110,9 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageCo
 
     try:
         logger.debug(f"Running tool {name}")
-        result = tool_handler.run_tool(arguments)
+        # Handlers block on HTTP calls to LogSeq; run them in a worker thread
+        # so concurrent tool calls don't stall the event loop
+        result = await asyncio.to_thread(tool_handler.run_tool, arguments)
         logger.debug(f"Tool result: {result}")
         return result
     except Exception as e:
@@ -1,29 +1,86 @@
 import os
+import re
 import json
 import logging
+import threading
+from itertools import islice
+from operator import itemgetter
 from . import logseq
 from mcp.types import Tool, TextContent
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
 logger = logging.getLogger("mcp-logseq")
 
+# Highlight markers LogSeq wraps around search matches in snippets
+_HIGHLIGHT_RE = re.compile(r"\$(?:pfts_2lqh>|<pfts_2lqh)\$")
+
 api_key = os.getenv("LOGSEQ_API_TOKEN", "")
 if api_key == "":
     raise ValueError("LOGSEQ_API_TOKEN environment variable required")
 else:
     logger.info("Found LOGSEQ_API_TOKEN in environment")
-    logger.debug(f"API Token starts with: {api_key[:5]}...")
+    logger.debug("API Token starts with: %s...", api_key[:5])
+
+_api: logseq.LogSeq | None = None
+_api_lock = threading.Lock()
+
+def _get_api() -> logseq.LogSeq:
+    """Return the LogSeq client shared by all tool handlers.
+
+    Created on first use; sharing it lets tool calls reuse the session's
+    keep-alive connections and read cache.
+    """
+    global _api
+    if _api is None:
+        with _api_lock:
+            if _api is None:
+                _api = logseq.LogSeq(api_key=api_key)
+    return _api
+
+def _format_json(data) -> str:
+    """Render an API result as indented JSON, falling back to str()."""
+    try:
+        if orjson is not None:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return str(data)
+
+def _get_bool(args: dict, key: str, default: bool = False) -> bool:
+    """Read a boolean tool argument, accepting true/1/"true" as true."""
+    value = args.get(key, default)
+    return value is True or value == 1 or value == "true"
 
 class ToolHandler():
+    # Subclasses declare empty __slots__ so handlers carry no instance dict
+    __slots__ = ("name", "_tool")
+
     def __init__(self, tool_name: str):
         self.name = tool_name
+        self._tool: Tool | None = None
 
     def get_tool_description(self) -> Tool:
         raise NotImplementedError()
 
+    @property
+    def tool(self) -> Tool:
+        """Tool description, built once from get_tool_description()."""
+        if self._tool is None:
+            self._tool = self.get_tool_description()
+        return self._tool
+
     def run_tool(self, args: dict) -> list[TextContent]:
         raise NotImplementedError()
 
 class CreatePageToolHandler(ToolHandler):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("create_page")
 
@@ -52,7 +109,7 @@ class CreatePageToolHandler(ToolHandler):
             raise RuntimeError("title and content arguments required")
 
         try:
-            api = logseq.LogSeq(api_key=api_key)
+            api = _get_api()
             api.create_page(args["title"], args["content"])
             
             return [TextContent(
@@ -60,10 +117,12 @@ class CreatePageToolHandler(ToolHandler):
                 text=f"Successfully created page '{args['title']}'"
             )]
         except Exception as e:
-            logger.error(f"Failed to create page: {str(e)}")
+            logger.error("Failed to create page: %s", str(e))
             raise
 
 class ListPagesToolHandler(ToolHandler):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("list_pages")
 
@@ -88,29 +147,26 @@ class ListPagesToolHandler(ToolHandler):
         include_journals = args.get("include_journals", False)
         
         try:
-            api = logseq.LogSeq(api_key=api_key)
+            api = _get_api()
             result = api.list_pages()
             
-            # Format pages for display
-            pages_info = []
+            # Collect (name, is_journal) pairs for the pages to display
+            pages = []
             for page in result:
                 # Skip if it's a journal page and we don't want to include those
                 is_journal = page.get('journal?', False)
                 if is_journal and not include_journals:
                     continue
                 
-                # Get page information
                 name = page.get('originalName') or page.get('name', '<unknown>')
-                
-                # Build page info string
-                info_parts = [f"- {name}"]
-                if is_journal:
-                    info_parts.append("[journal]")
-                    
-                pages_info.append(" ".join(info_parts))
+                pages.append((name, is_journal))
             
-            # Sort alphabetically by page name
-            pages_info.sort()
+            # Sort alphabetically by page name, then format in one pass
+            pages.sort(key=itemgetter(0))
+            pages_info = [
+                f"- {name} [journal]" if is_journal else f"- {name}"
+                for name, is_journal in pages
+            ]
             
             # Build response
             count_msg = f"\nTotal pages: {len(pages_info)}"
@@ -121,10 +177,12 @@ class ListPagesToolHandler(ToolHandler):
             return [TextContent(type="text", text=response)]
             
         except Exception as e:
-            logger.error(f"Failed to list pages: {str(e)}")
+            logger.error("Failed to list pages: %s", str(e))
             raise
 
 class GetPageContentToolHandler(ToolHandler):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("get_page_content")
 
@@ -152,13 +210,13 @@ class GetPageContentToolHandler(ToolHandler):
 
     def run_tool(self, args: dict) -> list[TextContent]:
         """Get and format LogSeq page content."""
-        logger.info(f"Getting page content with args: {args}")
+        logger.info("Getting page content with args: %s", args)
         
         if "page_name" not in args:
             raise RuntimeError("page_name argument required")
 
         try:
-            api = logseq.LogSeq(api_key=api_key)
+            api = _get_api()
             result = api.get_page_content(args["page_name"])
             
             if not result:
@@ -171,7 +229,7 @@ class GetPageContentToolHandler(ToolHandler):
             if args.get("format") == "json":
                 return [TextContent(
                     type="text",
-                    text=str(result)
+                    text=_format_json(result)
                 )]
 
             # Format as readable text
@@ -189,18 +247,23 @@ class GetPageContentToolHandler(ToolHandler):
             properties = page_info.get("properties", {})
             if properties:
                 content_parts.append("Properties:")
-                for key, value in properties.items():
-                    content_parts.append(f"- {key}: {value}")
+                content_parts.extend(f"- {key}: {value}" for key, value in properties.items())
                 content_parts.append("")
             
             # Blocks content
             if blocks:
                 content_parts.append("Content:")
-                for block in blocks:
-                    if isinstance(block, dict) and block.get("content"):
-                        content_parts.append(f"- {block['content']}")
-                    elif isinstance(block, str) and block.strip():
-                        content_parts.append(f"- {block}")
+                if isinstance(blocks[0], dict):
+                    # Block entities from getPageBlocksTree; skip per-block type checks
+                    content_parts.extend(
+                        f"- {content}" for block in blocks if (content := block.get("content"))
+                    )
+                else:
+                    for block in blocks:
+                        if isinstance(block, dict) and block.get("content"):
+                            content_parts.append(f"- {block['content']}")
+                        elif isinstance(block, str) and block.strip():
+                            content_parts.append(f"- {block}")
             else:
                 content_parts.append("No content blocks found.")
             
@@ -210,10 +273,12 @@ class GetPageContentToolHandler(ToolHandler):
             )]
 
         except Exception as e:
-            logger.error(f"Failed to get page content: {str(e)}")
+            logger.error("Failed to get page content: %s", str(e))
             raise
 
 class DeletePageToolHandler(ToolHandler):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("delete_page")
 
@@ -238,23 +303,22 @@ class DeletePageToolHandler(ToolHandler):
             raise RuntimeError("page_name argument required")
 
         try:
-            api = logseq.LogSeq(api_key=api_key)
+            api = _get_api()
             result = api.delete_page(args["page_name"])
             
             # Build detailed success message
             page_name = args["page_name"]
-            success_msg = f"✅ Successfully deleted page '{page_name}'"
+            lines = [f"✅ Successfully deleted page '{page_name}'"]
             
             # Add any additional info from the API result if available
-            if result and isinstance(result, dict):
-                if result.get("success"):
-                    success_msg += f"\n📋 Status: {result.get('message', 'Deletion confirmed')}"
+            if isinstance(result, dict) and result.get("success"):
+                lines.append(f"📋 Status: {result.get('message', 'Deletion confirmed')}")
             
-            success_msg += f"\n🗑️  Page '{page_name}' has been permanently removed from LogSeq"
+            lines.append(f"🗑️  Page '{page_name}' has been permanently removed from LogSeq")
             
             return [TextContent(
                 type="text",
-                text=success_msg
+                text="\n".join(lines)
             )]
         except ValueError as e:
             # Handle validation errors (page not found) gracefully
@@ -263,13 +327,28 @@ class DeletePageToolHandler(ToolHandler):
                 text=f"❌ Error: {str(e)}"
             )]
         except Exception as e:
-            logger.error(f"Failed to delete page: {str(e)}")
+            logger.error("Failed to delete page: %s", str(e))
             return [TextContent(
                 type="text",
                 text=f"❌ Failed to delete page '{args['page_name']}': {str(e)}"
             )]
 
+# Summary line shown for each kind of update reported by LogSeq.update_page
+_UPDATE_DETAILS = {
+    "properties": "📝 Properties updated",
+    "properties_fallback": "📝 Properties updated (via fallback method)",
+    "content": "📄 Content appended",
+}
+
+# Fixed response shared across calls; tool results are only read, never mutated
+_UPDATE_NOTHING_TO_DO = TextContent(
+    type="text",
+    text="❌ Error: Either 'content' or 'properties' must be provided for update"
+)
+
 class UpdatePageToolHandler(ToolHandler):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("update_page")
 
@@ -308,38 +387,23 @@ class UpdatePageToolHandler(ToolHandler):
         
         # Validate that at least one update is provided
         if not content and not properties:
-            return [TextContent(
-                type="text",
-                text="❌ Error: Either 'content' or 'properties' must be provided for update"
-            )]
+            return [_UPDATE_NOTHING_TO_DO]
 
         try:
-            api = logseq.LogSeq(api_key=api_key)
+            api = _get_api()
             result = api.update_page(page_name, content=content, properties=properties)
             
-            # Build detailed success message
-            success_msg = f"✅ Successfully updated page '{page_name}'"
-            
-            # Show what was updated
-            updates = result.get("updates", [])
-            update_details = []
-            
-            for update_type, update_result in updates:
-                if update_type == "properties":
-                    update_details.append("📝 Properties updated")
-                elif update_type == "properties_fallback":
-                    update_details.append("📝 Properties updated (via fallback method)")
-                elif update_type == "content":
-                    update_details.append("📄 Content appended")
-            
-            if update_details:
-                success_msg += f"\n{chr(10).join(update_details)}"
-            
-            success_msg += f"\n🔄 Page '{page_name}' has been updated in LogSeq"
+            # Build detailed success message, showing what was updated
+            lines = [f"✅ Successfully updated page '{page_name}'"]
+            for update_type, _ in result.get("updates", []):
+                detail = _UPDATE_DETAILS.get(update_type)
+                if detail:
+                    lines.append(detail)
+            lines.append(f"🔄 Page '{page_name}' has been updated in LogSeq")
             
             return [TextContent(
                 type="text",
-                text=success_msg
+                text="\n".join(lines)
             )]
         except ValueError as e:
             # Handle validation errors (page not found) gracefully
@@ -348,13 +412,15 @@ class UpdatePageToolHandler(ToolHandler):
                 text=f"❌ Error: {str(e)}"
             )]
         except Exception as e:
-            logger.error(f"Failed to update page: {str(e)}")
+            logger.error("Failed to update page: %s", str(e))
             return [TextContent(
                 type="text",
                 text=f"❌ Failed to update page '{page_name}': {str(e)}"
             )]
 
 class SearchToolHandler(ToolHandler):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("search")
 
@@ -396,7 +462,7 @@ class SearchToolHandler(ToolHandler):
 
     def run_tool(self, args: dict) -> list[TextContent]:
         """Execute search and format results."""
-        logger.info(f"Searching with args: {args}")
+        logger.info("Searching with args: %s", args)
         
         if "query" not in args:
             raise RuntimeError("query argument required")
@@ -411,7 +477,7 @@ class SearchToolHandler(ToolHandler):
             # Prepare search options
             search_options = {"limit": limit}
             
-            api = logseq.LogSeq(api_key=api_key)
+            api = _get_api()
             result = api.search_content(query, search_options)
             
             if not result:
@@ -420,53 +486,52 @@ class SearchToolHandler(ToolHandler):
                     text=f"No search results found for '{query}'"
                 )]
 
+            blocks = result.get("blocks") or []
+            snippets = result.get("pages-content") or []
+            pages = result.get("pages") or []
+            files = result.get("files") or []
+
             # Format results
             content_parts = []
             content_parts.append(f"# Search Results for '{query}'\n")
             
             # Block results
-            if include_blocks and result.get("blocks"):
-                blocks = result["blocks"]
+            if include_blocks and blocks:
                 content_parts.append(f"## 📄 Content Blocks ({len(blocks)} found)")
-                for i, block in enumerate(blocks[:limit]):
+                for i, block in enumerate(islice(blocks, limit), start=1):
                     # LogSeq returns blocks with 'block/content' key
                     content = block.get("block/content", "").strip()
                     if content:
                         # Truncate long content
                         if len(content) > 150:
                             content = content[:150] + "..."
-                        content_parts.append(f"{i+1}. {content}")
+                        content_parts.append(f"{i}. {content}")
                 content_parts.append("")
 
             # Page snippet results  
-            if include_blocks and result.get("pages-content"):
-                snippets = result["pages-content"]
+            if include_blocks and snippets:
                 content_parts.append(f"## 📝 Page Snippets ({len(snippets)} found)")
-                for i, snippet in enumerate(snippets[:limit]):
+                for i, snippet in enumerate(islice(snippets, limit), start=1):
                     # LogSeq returns snippets with 'block/snippet' key  
                     snippet_text = snippet.get("block/snippet", "").strip()
                     if snippet_text:
                         # Clean up snippet text
-                        snippet_text = snippet_text.replace("$pfts_2lqh>$", "").replace("$<pfts_2lqh$", "")
+                        snippet_text = _HIGHLIGHT_RE.sub("", snippet_text)
                         if len(snippet_text) > 200:
                             snippet_text = snippet_text[:200] + "..."
-                        content_parts.append(f"{i+1}. {snippet_text}")
+                        content_parts.append(f"{i}. {snippet_text}")
                 content_parts.append("")
 
             # Page name results
-            if include_pages and result.get("pages"):
-                pages = result["pages"]
+            if include_pages and pages:
                 content_parts.append(f"## 📑 Matching Pages ({len(pages)} found)")
-                for page in pages:
-                    content_parts.append(f"- {page}")
+                content_parts.extend(f"- {page}" for page in pages)
                 content_parts.append("")
 
             # File results
-            if include_files and result.get("files"):
-                files = result["files"]
+            if include_files and files:
                 content_parts.append(f"## 📁 Matching Files ({len(files)} found)")
-                for file_path in files:
-                    content_parts.append(f"- {file_path}")
+                content_parts.extend(f"- {file_path}" for file_path in files)
                 content_parts.append("")
 
             # Pagination info
@@ -474,7 +539,7 @@ class SearchToolHandler(ToolHandler):
                 content_parts.append("📌 *More results available - increase limit to see more*")
 
             # Summary
-            total_results = len(result.get("blocks", [])) + len(result.get("pages", [])) + len(result.get("files", []))
+            total_results = len(blocks) + len(pages) + len(files)
             content_parts.append(f"\n**Total results found: {total_results}**")
 
             response_text = "\n".join(content_parts)
@@ -482,7 +547,7 @@ class SearchToolHandler(ToolHandler):
             return [TextContent(type="text", text=response_text)]
             
         except Exception as e:
-            logger.error(f"Failed to search: {str(e)}")
+            logger.error("Failed to search: %s", str(e))
             return [TextContent(
                 type="text",
                 text=f"❌ Search failed: {str(e)}"
@@ -490,6 +555,8 @@ class SearchToolHandler(ToolHandler):
 
 
 class InsertBlockToolHandler(ToolHandler):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("insert_block")
 
@@ -532,12 +599,12 @@ class InsertBlockToolHandler(ToolHandler):
         if not content:
             raise RuntimeError("content argument required")
 
-        api = logseq.LogSeq(api_key=api_key)
+        api = _get_api()
         result = api.insert_block(
             args.get("parent_block"),
             content,
-            is_page_block=bool(args.get("is_page_block", False)),
-            before=bool(args.get("before", False)),
+            is_page_block=_get_bool(args, "is_page_block"),
+            before=_get_bool(args, "before"),
             custom_uuid=args.get("custom_uuid"),
         )
 
@@ -557,6 +624,8 @@ class InsertBlockToolHandler(ToolHandler):
 
 
 class UpdateBlockToolHandler(ToolHandler):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("update_block")
 
@@ -590,7 +659,7 @@ class UpdateBlockToolHandler(ToolHandler):
         if not block_uuid or content is None:
             raise RuntimeError("block_uuid and content arguments required")
 
-        api = logseq.LogSeq(api_key=api_key)
+        api = _get_api()
         result = api.update_block(block_uuid, content, pos=args.get("pos"))
 
         return [TextContent(
@@ -600,6 +669,8 @@ class UpdateBlockToolHandler(ToolHandler):
 
 
 class DeleteBlockToolHandler(ToolHandler):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("delete_block")
 
@@ -624,7 +695,7 @@ class DeleteBlockToolHandler(ToolHandler):
         if not block_uuid:
             raise RuntimeError("block_uuid argument required")
 
-        api = logseq.LogSeq(api_key=api_key)
+        api = _get_api()
         result = api.delete_block(block_uuid)
 
         return [TextContent(
@@ -634,6 +705,8 @@ class DeleteBlockToolHandler(ToolHandler):
 
 
 class GetBlockToolHandler(ToolHandler):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("get_block")
 
@@ -663,18 +736,15 @@ class GetBlockToolHandler(ToolHandler):
         if not block_uuid:
             raise RuntimeError("block_uuid argument required")
 
-        api = logseq.LogSeq(api_key=api_key)
-        result = api.get_block(block_uuid, include_children=bool(args.get("include_children", False)))
+        api = _get_api()
+        result = api.get_block(block_uuid, include_children=_get_bool(args, "include_children"))
 
-        try:
-            formatted = json.dumps(result, indent=2, ensure_ascii=False)
-        except Exception:
-            formatted = str(result)
-
-        return [TextContent(type="text", text=formatted)]
+        return [TextContent(type="text", text=_format_json(result))]
 
 
 class ReplaceChildrenToolHandler(ToolHandler):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("replace_children")
 
@@ -739,12 +809,12 @@ class ReplaceChildrenToolHandler(ToolHandler):
         if not isinstance(blocks, list):
             raise RuntimeError("blocks argument must be an array")
 
-        api = logseq.LogSeq(api_key=api_key)
+        api = _get_api()
         inserted = api.replace_children(
             parent=target,
             blocks=blocks,
-            is_page=bool(args.get("is_page", False)),
-            delete_existing=bool(args.get("delete_existing", True)),
+            is_page=_get_bool(args, "is_page"),
+            delete_existing=_get_bool(args, "delete_existing", True),
         )
 
         summary = [
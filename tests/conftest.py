@@ -1,6 +1,7 @@
 import pytest
 import responses
 from unittest.mock import Mock, patch
+from mcp_logseq import tools
 from mcp_logseq.logseq import LogSeq
 from mcp_logseq.tools import (
     CreatePageToolHandler,
@@ -11,6 +12,13 @@ from mcp_logseq.tools import (
     SearchToolHandler
 )
 
+@pytest.fixture(autouse=True)
+def reset_shared_api():
+    """Drop the tools' shared LogSeq client so each test builds its own."""
+    tools._api = None
+    yield
+    tools._api = None
+
 @pytest.fixture
 def mock_api_key():
     """Provide a mock API key for testing."""
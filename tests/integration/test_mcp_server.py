@@ -1,8 +1,9 @@
 import pytest
 import asyncio
+import threading
 from unittest.mock import patch, Mock, AsyncMock
 from mcp.types import Tool, TextContent
-from mcp_logseq.server import app, tool_handlers, add_tool_handler, get_tool_handler
+from mcp_logseq.server import app, call_tool, tool_handlers, add_tool_handler, get_tool_handler
 
 class TestMCPServerIntegration:
     """Integration tests for the MCP server."""
@@ -82,6 +83,21 @@ class TestMCPServerIntegration:
         # Verify API was called
         mock_api.create_page.assert_called_once_with("Test Page", "Test content")
 
+    @pytest.mark.asyncio
+    @patch('mcp_logseq.tools.logseq.LogSeq')
+    async def test_call_tool_runs_handler_off_event_loop(self, mock_logseq_class):
+        """Test that call_tool runs blocking handlers in a worker thread."""
+        loop_thread = threading.current_thread()
+        handler_threads = []
+        mock_logseq_class.return_value.create_page.side_effect = (
+            lambda *args: handler_threads.append(threading.current_thread())
+        )
+
+        result = await call_tool("create_page", {"title": "Test Page", "content": ""})
+
+        assert "Successfully created page 'Test Page'" in result[0].text
+        assert handler_threads and handler_threads[0] is not loop_thread
+
     def test_call_tool_unknown_tool_integration(self):
         """Test calling an unknown tool through handler system."""
         handler = get_tool_handler("unknown_tool")
@@ -1,9 +1,13 @@
+import gzip
 import json
+import httpx
 import pytest
 import responses
 import requests
+import threading
+from responses import matchers
 from unittest.mock import patch
-from mcp_logseq.logseq import LogSeq
+from mcp_logseq.logseq import AsyncLogSeq, LogSeq
 
 class TestLogSeqAPI:
     """Test cases for the LogSeq API client."""
@@ -34,6 +38,7 @@ class TestLogSeqAPI:
         assert client.host == 'localhost'
         assert client.port == 8080
         assert client.verify_ssl == True
+        assert client._session.verify == True
 
     def test_get_base_url(self, logseq_client):
         """Test base URL generation."""
@@ -129,29 +134,19 @@ class TestLogSeqAPI:
     @responses.activate
     def test_get_page_content_success(self, logseq_client, mock_logseq_responses):
         """Test successful page content retrieval."""
-        # Mock getPage call
-        responses.add(
-            responses.POST,
-            "http://127.0.0.1:12315/api",
-            json=mock_logseq_responses["get_page_success"],
-            status=200
-        )
-        
-        # Mock getPageBlocksTree call
-        responses.add(
-            responses.POST,
-            "http://127.0.0.1:12315/api",
-            json=mock_logseq_responses["get_page_blocks_success"],
-            status=200
-        )
-        
-        # Mock getPageProperties call
-        responses.add(
-            responses.POST,
-            "http://127.0.0.1:12315/api",
-            json=mock_logseq_responses["get_page_properties_success"],
-            status=200
-        )
+        # The three lookups run concurrently, so match responses by method
+        for method, key in [
+            ("logseq.Editor.getPage", "get_page_success"),
+            ("logseq.Editor.getPageBlocksTree", "get_page_blocks_success"),
+            ("logseq.Editor.getPageProperties", "get_page_properties_success"),
+        ]:
+            responses.add(
+                responses.POST,
+                "http://127.0.0.1:12315/api",
+                json=mock_logseq_responses[key],
+                status=200,
+                match=[matchers.json_params_matcher({"method": method, "args": ["Test Page"]})]
+            )
         
         result = logseq_client.get_page_content("Test Page")
         
@@ -182,14 +177,57 @@ class TestLogSeqAPI:
         result = logseq_client.get_page_content("Non-existent Page")
         assert result is None
 
+    @responses.activate
+    def test_iter_page_blocks(self, logseq_client, mock_logseq_responses):
+        """Test iterating over a page's top-level blocks."""
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            json=mock_logseq_responses["get_page_blocks_success"],
+            status=200
+        )
+
+        with patch("mcp_logseq.logseq.ijson", None):
+            blocks = list(logseq_client.iter_page_blocks("Test Page"))
+
+        assert blocks == mock_logseq_responses["get_page_blocks_success"]
+        request_data = json.loads(responses.calls[0].request.body)
+        assert request_data["method"] == "logseq.Editor.getPageBlocksTree"
+        assert request_data["args"] == ["Test Page"]
+
+    @responses.activate
+    def test_iter_page_blocks_streams_with_ijson(self, logseq_client):
+        """Test that ijson parses a gzip-encoded blocks response incrementally."""
+        ijson = pytest.importorskip("ijson")
+        blocks = [{"id": 1, "content": "First", "weight": 0.5}, {"id": 2, "content": "Second"}]
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            body=gzip.compress(json.dumps(blocks).encode()),
+            status=200,
+            headers={"Content-Encoding": "gzip"},
+            content_type="application/json",
+        )
+
+        with patch("mcp_logseq.logseq.ijson", ijson):
+            assert list(logseq_client.iter_page_blocks("Test Page")) == blocks
+
+    @responses.activate
+    def test_iter_page_blocks_error(self, logseq_client):
+        """Test that streaming errors are raised to the caller."""
+        responses.add(responses.POST, "http://127.0.0.1:12315/api", status=500)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            list(logseq_client.iter_page_blocks("Test Page"))
+
     @responses.activate
     def test_delete_page_success(self, logseq_client, mock_logseq_responses):
         """Test successful page deletion."""
-        # Mock list_pages call for validation
+        # Mock getPage call for validation
         responses.add(
             responses.POST,
             "http://127.0.0.1:12315/api",
-            json=mock_logseq_responses["list_pages_success"],
+            json=mock_logseq_responses["get_page_success"],
             status=200
         )
         
@@ -210,17 +248,39 @@ class TestLogSeqAPI:
     @responses.activate
     def test_delete_page_not_found(self, logseq_client, mock_logseq_responses):
         """Test deletion of non-existent page."""
-        # Mock list_pages call for validation
+        # Mock getPage returning null for validation
         responses.add(
             responses.POST,
             "http://127.0.0.1:12315/api",
-            json=mock_logseq_responses["list_pages_success"],
-            status=200
+            body='null',
+            status=200,
+            content_type='application/json'
         )
         
         with pytest.raises(ValueError, match="Page 'Non-existent' does not exist"):
             logseq_client.delete_page("Non-existent")
 
+        # Only the getPage probe was sent, not a full page listing
+        assert len(responses.calls) == 1
+        request_data = json.loads(responses.calls[0].request.body)
+        assert request_data["method"] == "logseq.Editor.getPage"
+        assert request_data["args"] == ["Non-existent"]
+
+    @responses.activate
+    def test_delete_page_without_validation(self, logseq_client):
+        """Test that validate=False skips the existence probe."""
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            json={"success": True},
+            status=200
+        )
+
+        assert logseq_client.delete_page("Page One", validate=False) == {"success": True}
+        assert len(responses.calls) == 1
+        request_data = json.loads(responses.calls[0].request.body)
+        assert request_data["method"] == "logseq.Editor.deletePage"
+
     @responses.activate
     def test_search_content_success(self, logseq_client, mock_logseq_responses):
         """Test successful content search."""
@@ -260,11 +320,11 @@ class TestLogSeqAPI:
     @responses.activate
     def test_update_page_success(self, logseq_client, mock_logseq_responses):
         """Test successful page update."""
-        # Mock list_pages call for validation
+        # Mock getPage call for validation
         responses.add(
             responses.POST,
             "http://127.0.0.1:12315/api",
-            json=mock_logseq_responses["list_pages_success"],
+            json=mock_logseq_responses["get_page_success"],
             status=200
         )
         
@@ -296,4 +356,681 @@ class TestLogSeqAPI:
         assert result == expected
         
         # Verify all calls were made
-        assert len(responses.calls) == 3
\ No newline at end of file
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_update_page_properties_fallback(self, logseq_client, mock_logseq_responses):
+        """Test that a failed updatePage falls back to setPageProperties."""
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            json=mock_logseq_responses["get_page_success"],
+            status=200
+        )
+        responses.add(responses.POST, "http://127.0.0.1:12315/api", status=500)
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            json={"success": True},
+            status=200
+        )
+
+        result = logseq_client.update_page("Page One", properties={"priority": "high"})
+
+        assert result == {
+            "updates": [("properties_fallback", {"success": True})],
+            "page": "Page One"
+        }
+        fallback_request = json.loads(responses.calls[2].request.body)
+        assert fallback_request["method"] == "logseq.Editor.setPageProperties"
+
+    @responses.activate
+    def test_update_page_fallback_sets_properties_before_content(self, logseq_client, mock_logseq_responses):
+        """Test that fallback properties are written before content is appended."""
+        def callback(request):
+            method = json.loads(request.body)["method"]
+            if method == "logseq.Editor.getPage":
+                return (200, {}, json.dumps(mock_logseq_responses["get_page_success"]))
+            if method == "logseq.Editor.updatePage":
+                return (500, {}, "")
+            return (200, {}, json.dumps({"success": True}))
+
+        responses.add_callback(responses.POST, "http://127.0.0.1:12315/api", callback=callback)
+
+        logseq_client.update_page("Page One", content="New content", properties={"priority": "high"})
+
+        methods = [json.loads(c.request.body)["method"] for c in responses.calls]
+        assert methods == [
+            "logseq.Editor.getPage",
+            "logseq.Editor.updatePage",
+            "logseq.Editor.setPageProperties",
+            "logseq.Editor.appendBlockInPage",
+        ]
+
+    @responses.activate
+    def test_batch_returns_results_in_call_order(self, logseq_client):
+        """Test that batched calls are sent in order and results stay aligned."""
+        responses.add(responses.POST, "http://127.0.0.1:12315/api", json={"n": 1}, status=200)
+        responses.add(responses.POST, "http://127.0.0.1:12315/api", status=500)
+        responses.add(responses.POST, "http://127.0.0.1:12315/api", json={"n": 3}, status=200)
+
+        results = logseq_client.batch(
+            [
+                ("logseq.Editor.getPage", ["A"]),
+                ("logseq.Editor.getPage", ["B"]),
+                ("logseq.Editor.getPage", ["C"]),
+            ],
+            return_exceptions=True,
+        )
+
+        assert results[0] == {"n": 1}
+        assert isinstance(results[1], requests.exceptions.HTTPError)
+        assert results[2] == {"n": 3}
+        assert [json.loads(c.request.body)["args"] for c in responses.calls] == [["A"], ["B"], ["C"]]
+
+    @responses.activate
+    def test_insert_blocks(self, logseq_client):
+        """Test inserting several blocks through a single batch."""
+        responses.add(responses.POST, "http://127.0.0.1:12315/api", json={"uuid": "b-1"}, status=200)
+
+        results = logseq_client.insert_blocks([
+            {"parent_block": "Page One", "content": "First", "is_page_block": True},
+            {"parent_block": "b-1", "content": "Second"},
+        ])
+
+        assert results == [{"uuid": "b-1"}, {"uuid": "b-1"}]
+        second = json.loads(responses.calls[1].request.body)
+        assert second["method"] == "logseq.Editor.insertBlock"
+        assert second["args"] == ["b-1", "Second", {}]
+        first = json.loads(responses.calls[0].request.body)
+        assert first["args"][2] == {"isPageBlock": True}
+
+    @staticmethod
+    def _replace_children_callback(batch_status=200, flat_batch_result=True):
+        """Emulate the replace_children API calls, tracking the parent's children.
+
+        insertBatchBlock answers like LogSeq: null, or a flat list of every
+        inserted block, and without sibling it inserts before existing children.
+        """
+        children = [{"uuid": "old-1"}, {"uuid": "old-2"}, {"content": "no uuid"}]
+
+        def flatten(blocks):
+            for block in blocks:
+                yield block
+                yield from flatten(block.get("children", []))
+
+        def callback(request):
+            body = json.loads(request.body)
+            method, args = body["method"], body["args"]
+            if method in ("logseq.Editor.getBlockChildrenTree", "logseq.Editor.getPageBlocksTree"):
+                result = children
+            elif method == "logseq.Editor.removeBlock":
+                children[:] = [child for child in children if child.get("uuid") != args[0]]
+                result = None
+            elif method == "logseq.Editor.insertBatchBlock":
+                if batch_status == 404:
+                    return (404, {}, json.dumps({"error": "MethodNotExist"}))
+                if batch_status != 200:
+                    return (batch_status, {}, json.dumps({"error": "Internal error"}))
+                roots = [{"uuid": f"new-{b['content']}"} for b in args[1]]
+                if args[2]["sibling"]:
+                    uuids = [child.get("uuid") for child in children]
+                    index = uuids.index(args[0]) + 1
+                else:
+                    index = 0
+                children[index:index] = roots
+                result = None
+                if flat_batch_result:
+                    result = [{"uuid": f"new-{b['content']}"} for b in flatten(args[1])]
+            elif method == "logseq.Editor.insertBlock":
+                result = {"uuid": f"new-{args[1]}"}
+                if args[0] in ("parent-uuid", "Page One"):
+                    children.append(result)
+            else:
+                result = None
+            return (200, {}, json.dumps(result))
+
+        callback.children = children
+        return callback
+
+    @pytest.mark.parametrize("flat_batch_result", [True, False])
+    @responses.activate
+    def test_replace_children(self, logseq_client, flat_batch_result):
+        """Test replacing a block's children deletes old ones and batch inserts the new tree."""
+        responses.add_callback(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            callback=self._replace_children_callback(flat_batch_result=flat_batch_result),
+        )
+
+        inserted = logseq_client.replace_children(
+            "parent-uuid",
+            [
+                {"content": "A", "children": [{"content": "A1", "custom_uuid": "c-1"}]},
+                {"content": "B"},
+            ],
+        )
+
+        assert inserted == ["new-A", "new-B"]
+        bodies = [json.loads(c.request.body) for c in responses.calls]
+        deleted = {b["args"][0] for b in bodies if b["method"] == "logseq.Editor.removeBlock"}
+        assert deleted == {"old-1", "old-2"}
+        batch = [b for b in bodies if b["method"] == "logseq.Editor.insertBatchBlock"]
+        assert batch == [{
+            "method": "logseq.Editor.insertBatchBlock",
+            "args": [
+                "parent-uuid",
+                [
+                    {
+                        "content": "A",
+                        "children": [{"content": "A1", "properties": {"id": "c-1"}}],
+                    },
+                    {"content": "B"},
+                ],
+                {"sibling": False, "before": False, "keepUUID": True},
+            ],
+        }]
+        assert not any(b["method"] == "logseq.Editor.insertBlock" for b in bodies)
+
+    @pytest.mark.parametrize("batch_status", [200, 404])
+    @responses.activate
+    def test_replace_children_keeps_existing_and_appends(self, logseq_client, batch_status):
+        """Test that both insert paths append after children that are kept."""
+        callback = self._replace_children_callback(batch_status=batch_status)
+        callback.children[:] = [{"uuid": "old-1"}, {"uuid": "old-2"}]
+        responses.add_callback(responses.POST, "http://127.0.0.1:12315/api", callback=callback)
+
+        inserted = logseq_client.replace_children(
+            "parent-uuid",
+            [{"content": "A", "children": [{"content": "A1"}]}, {"content": "B"}],
+            delete_existing=False,
+        )
+
+        assert inserted == ["new-A", "new-B"]
+        assert [child["uuid"] for child in callback.children] == [
+            "old-1", "old-2", "new-A", "new-B"
+        ]
+        bodies = [json.loads(c.request.body) for c in responses.calls]
+        assert not any(b["method"] == "logseq.Editor.removeBlock" for b in bodies)
+        batch = [b["args"] for b in bodies if b["method"] == "logseq.Editor.insertBatchBlock"]
+        assert batch[0][0] == "old-2"
+        assert batch[0][2]["sibling"] is True
+
+    @responses.activate
+    def test_replace_children_falls_back_without_batch_insert(self, logseq_client):
+        """Test that a missing insertBatchBlock falls back to per-block inserts."""
+        responses.add_callback(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            callback=self._replace_children_callback(batch_status=404),
+        )
+
+        inserted = logseq_client.replace_children(
+            "parent-uuid",
+            [
+                {
+                    "content": "A",
+                    "children": [
+                        {"content": "A1", "children": [{"content": "A1a"}]},
+                        {"content": "A2"},
+                    ],
+                },
+                {"content": "B"},
+            ],
+            delete_existing=False,
+        )
+
+        assert inserted == ["new-A", "new-B"]
+        bodies = [json.loads(c.request.body) for c in responses.calls]
+        inserts = [b["args"][:2] for b in bodies if b["method"] == "logseq.Editor.insertBlock"]
+        assert inserts == [
+            ["parent-uuid", "A"],
+            ["new-A", "A1"],
+            ["new-A1", "A1a"],
+            ["new-A", "A2"],
+            ["parent-uuid", "B"],
+        ]
+
+    @responses.activate
+    def test_replace_children_reraises_batch_insert_errors(self, logseq_client):
+        """Test that insertBatchBlock failures other than a missing method are raised."""
+        responses.add_callback(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            callback=self._replace_children_callback(batch_status=500),
+        )
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            logseq_client.replace_children("parent-uuid", [{"content": "A"}])
+
+        bodies = [json.loads(c.request.body) for c in responses.calls]
+        assert not any(b["method"] == "logseq.Editor.insertBlock" for b in bodies)
+
+    @responses.activate
+    def test_replace_children_on_page_inserts_blocks(self, logseq_client):
+        """Test that page parents use per-block inserts as page blocks."""
+        responses.add_callback(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            callback=self._replace_children_callback(),
+        )
+
+        inserted = logseq_client.replace_children(
+            "Page One", [{"content": "A"}], is_page=True
+        )
+
+        assert inserted == ["new-A"]
+        bodies = [json.loads(c.request.body) for c in responses.calls]
+        assert bodies[0]["method"] == "logseq.Editor.getPageBlocksTree"
+        inserts = [b["args"] for b in bodies if b["method"] == "logseq.Editor.insertBlock"]
+        assert inserts[0][:2] == ["Page One", "A"]
+        assert inserts[0][2]["isPageBlock"] is True
+
+    @responses.activate
+    def test_requests_reuse_session_auth_header(self, logseq_client, mock_logseq_responses):
+        """Test that calls go through the pooled session with the auth header set."""
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            json=mock_logseq_responses["search_success"],
+            status=200
+        )
+
+        logseq_client.search_content("first")
+        logseq_client.search_content("second")
+
+        assert len(responses.calls) == 2
+        for call in responses.calls:
+            assert call.request.headers["Authorization"] == f"Bearer {logseq_client.api_key}"
+
+    @responses.activate
+    def test_read_cache_skips_repeated_requests(self, logseq_client, mock_logseq_responses):
+        """Test that repeated reads are served from the read cache."""
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            json=mock_logseq_responses["list_pages_success"],
+            status=200
+        )
+
+        first = logseq_client.list_pages()
+        second = logseq_client.list_pages()
+
+        assert first == second == mock_logseq_responses["list_pages_success"]
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_write_invalidates_read_cache(self, logseq_client, mock_logseq_responses):
+        """Test that a write clears cached reads."""
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            json=mock_logseq_responses["list_pages_success"],
+            status=200
+        )
+
+        logseq_client.list_pages()
+        logseq_client.create_page("New Page")
+        logseq_client.list_pages()
+
+        methods = [json.loads(c.request.body)["method"] for c in responses.calls]
+        assert methods == [
+            "logseq.Editor.getAllPages",
+            "logseq.Editor.createPage",
+            "logseq.Editor.getAllPages",
+        ]
+
+    @responses.activate
+    def test_invalidate_single_page(self, logseq_client, mock_logseq_responses):
+        """Test that invalidating a page keeps other cached reads."""
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            json=mock_logseq_responses["get_page_success"],
+            status=200
+        )
+
+        logseq_client.get_page_content("Test Page")
+        logseq_client.list_pages()
+        logseq_client.invalidate("Test Page")
+        logseq_client.get_page_content("Test Page")
+        logseq_client.list_pages()
+
+        methods = [json.loads(c.request.body)["method"] for c in responses.calls]
+        assert len(methods) == 7
+        assert methods.count("logseq.Editor.getPage") == 2
+        assert methods.count("logseq.Editor.getAllPages") == 1
+
+    @responses.activate
+    def test_page_exists_reuses_cached_lookup(self, logseq_client, mock_logseq_responses):
+        """Test that validation reuses a getPage result fetched moments earlier."""
+        for method, key in [
+            ("logseq.Editor.getPage", "get_page_success"),
+            ("logseq.Editor.getPageBlocksTree", "get_page_blocks_success"),
+            ("logseq.Editor.getPageProperties", "get_page_properties_success"),
+        ]:
+            responses.add(
+                responses.POST,
+                "http://127.0.0.1:12315/api",
+                json=mock_logseq_responses[key],
+                status=200,
+                match=[matchers.json_params_matcher({"method": method, "args": ["Test Page"]})]
+            )
+        responses.add(responses.POST, "http://127.0.0.1:12315/api", json={"success": True}, status=200)
+
+        logseq_client.get_page_content("Test Page")
+        logseq_client.delete_page("Test Page")
+
+        methods = [json.loads(c.request.body)["method"] for c in responses.calls]
+        assert methods.count("logseq.Editor.getPage") == 1
+        assert methods[-1] == "logseq.Editor.deletePage"
+
+    @responses.activate
+    def test_page_exists_rechecks_cached_miss(self, logseq_client, mock_logseq_responses):
+        """Test that a cached missing page is looked up again before failing validation."""
+        page = {"found": False}
+
+        def callback(request):
+            method = json.loads(request.body)["method"]
+            if method == "logseq.Editor.getPage":
+                result = mock_logseq_responses["get_page_success"] if page["found"] else None
+            elif method == "logseq.Editor.getPageBlocksTree":
+                result = []
+            else:
+                result = {"success": True}
+            return (200, {}, json.dumps(result))
+
+        responses.add_callback(responses.POST, "http://127.0.0.1:12315/api", callback=callback)
+
+        assert logseq_client.get_page_content("Foo") is None
+        # The page is created outside this client, e.g. in the LogSeq UI
+        page["found"] = True
+        logseq_client.update_page("Foo", content="x")
+
+        methods = [json.loads(c.request.body)["method"] for c in responses.calls]
+        assert methods.count("logseq.Editor.getPage") == 2
+        assert methods[-1] == "logseq.Editor.appendBlockInPage"
+
+    @responses.activate
+    def test_cache_ttl_zero_disables_cache(self, mock_api_key, mock_logseq_responses):
+        """Test that cache_ttl=0 sends every read to the API."""
+        client = LogSeq(api_key=mock_api_key, cache_ttl=0)
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            json=mock_logseq_responses["list_pages_success"],
+            status=200
+        )
+
+        client.list_pages()
+        client.list_pages()
+
+        assert len(responses.calls) == 2
+        assert client._read_cache == {}
+
+    def test_read_cache_expires(self, logseq_client):
+        """Test that cached entries expire after the TTL."""
+        with patch("mcp_logseq.logseq.time.monotonic", return_value=100.0):
+            logseq_client._cache_put(("logseq.Editor.getAllPages", "[]"), b'["page"]', 0)
+            assert logseq_client._cache_get(("logseq.Editor.getAllPages", "[]")) == b'["page"]'
+
+        with patch("mcp_logseq.logseq.time.monotonic", return_value=200.0):
+            logseq_client._cache_get(("logseq.Editor.getAllPages", "[]"))
+            assert logseq_client._read_cache == {}
+
+    @responses.activate
+    def test_read_cache_returns_independent_copies(self, logseq_client, mock_logseq_responses):
+        """Test that mutating a cached result does not change later hits."""
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            json=mock_logseq_responses["list_pages_success"],
+            status=200
+        )
+
+        first = logseq_client.list_pages()
+        first.append("x")
+        second = logseq_client.list_pages()
+        second[0]["name"] = "changed"
+
+        assert logseq_client.list_pages() == mock_logseq_responses["list_pages_success"]
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_read_during_write_is_not_served_afterwards(self, logseq_client):
+        """Test that a read cached while a write is in flight is dropped."""
+        def callback(request):
+            method = json.loads(request.body)["method"]
+            if method == "logseq.Editor.createPage":
+                # A concurrent reader caches the pre-write page list
+                logseq_client.list_pages()
+                return (200, {}, json.dumps({"created": True}))
+            return (200, {}, json.dumps([]))
+
+        responses.add_callback(responses.POST, "http://127.0.0.1:12315/api", callback=callback)
+
+        logseq_client.create_page("New Page")
+        logseq_client.list_pages()
+
+        methods = [json.loads(c.request.body)["method"] for c in responses.calls]
+        assert methods.count("logseq.Editor.getAllPages") == 2
+
+    def test_read_cache_rejects_reads_overlapping_a_write(self, logseq_client):
+        """Test that a read started before an invalidation is not cached."""
+        key = ("logseq.Editor.getAllPages", "[]")
+        generation = logseq_client._cache_generation
+
+        logseq_client.invalidate()
+        logseq_client._cache_put(key, b'["stale"]', generation)
+
+        assert logseq_client._read_cache == {}
+
+    @responses.activate
+    def test_delete_block_without_decode(self, logseq_client):
+        """Test that decode=False skips parsing the response body."""
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:12315/api",
+            body="not json",
+            status=200,
+        )
+
+        assert logseq_client.delete_block("uuid-1", decode=False) is None
+        assert json.loads(responses.calls[0].request.body) == {
+            "method": "logseq.Editor.removeBlock",
+            "args": ["uuid-1"],
+        }
+
+    def test_encode_call_matches_json_envelope(self):
+        """Test that the precompiled envelope encodes to the expected payload."""
+        from mcp_logseq.logseq import _encode_call
+
+        body = _encode_call("logseq.Editor.insertBlock", ["uuid-1", "Text \"quoted\"", {"before": False}])
+
+        assert json.loads(body) == {
+            "method": "logseq.Editor.insertBlock",
+            "args": ["uuid-1", 'Text "quoted"', {"before": False}],
+        }
+
+    @pytest.mark.parametrize("result,expected", [
+        ("uuid-1", "uuid-1"),
+        ({"uuid": "uuid-1", "id": 42}, "uuid-1"),
+        ({"uuid": None, "id": "uuid-2"}, "uuid-2"),
+        ({"block": {"uuid": "uuid-3"}}, "uuid-3"),
+        ({"id": 42, "block": None}, None),
+        (None, None),
+    ])
+    def test_extract_block_uuid(self, result, expected):
+        """Test that block UUIDs are found at the top level or under 'block'."""
+        assert LogSeq._extract_block_uuid(result) == expected
+
+    def test_session_retries_transient_errors(self, logseq_client):
+        """Test that the session adapter retries transient API failures."""
+        adapter = logseq_client._session.get_adapter("http://127.0.0.1:12315/api")
+        assert logseq_client._session.get_adapter("https://localhost/api") is adapter
+        retries = adapter.max_retries
+
+        assert retries.total == 3
+        assert retries.read == 0
+        assert "POST" in retries.allowed_methods
+        assert set(retries.status_forcelist) == {429, 502, 503, 504}
+
+    def test_session_ignores_environment_by_default(self, mock_api_key):
+        """Test that proxy/netrc environment lookups are opt-in."""
+        assert LogSeq(api_key=mock_api_key)._session.trust_env is False
+        assert LogSeq(api_key=mock_api_key, trust_env=True)._session.trust_env is True
+
+    def test_executor_is_created_once_across_threads(self, logseq_client):
+        """Test that concurrent first uses share a single thread pool."""
+        barrier = threading.Barrier(8)
+        executors = []
+
+        def worker():
+            barrier.wait()
+            executors.append(logseq_client._get_executor())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(executor) for executor in executors}) == 1
+        logseq_client.close()
+
+    def test_context_manager_closes_session(self, mock_api_key):
+        """Test that leaving the context manager closes the session."""
+        with patch("requests.Session.close") as mock_close:
+            with LogSeq(api_key=mock_api_key):
+                pass
+            mock_close.assert_called_once()
+
+
+def _mock_async_client(mock_api_key, results_by_method):
+    """Build an AsyncLogSeq whose transport answers per API method."""
+    calls = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        calls.append(body)
+        result = results_by_method[body["method"]]
+        if callable(result):
+            result = result(body)
+        return httpx.Response(
+            200,
+            content=json.dumps(result),
+            headers={"Content-Type": "application/json"},
+        )
+
+    client = AsyncLogSeq(api_key=mock_api_key)
+    client._client = httpx.AsyncClient(
+        base_url="http://127.0.0.1:12315",
+        headers={'Authorization': f'Bearer {mock_api_key}'},
+        transport=httpx.MockTransport(handler),
+    )
+    return client, calls
+
+
+class TestAsyncLogSeqAPI:
+    """Test cases for the async LogSeq API client."""
+
+    def test_init_defaults_to_http1(self, mock_api_key):
+        """Test that HTTP/2 is opt-in."""
+        client = AsyncLogSeq(api_key=mock_api_key)
+        assert client.http2 is False
+
+    def test_init_with_http2(self, mock_api_key):
+        """Test that http2=True is passed through to httpx."""
+        pytest.importorskip("h2")
+        client = AsyncLogSeq(api_key=mock_api_key, protocol='https', http2=True)
+        assert client.http2 is True
+
+    @pytest.mark.asyncio
+    async def test_get_page_content_success(self, mock_api_key, mock_logseq_responses):
+        """Test that page content is assembled from the three concurrent lookups."""
+        client, calls = _mock_async_client(mock_api_key, {
+            "logseq.Editor.getPage": mock_logseq_responses["get_page_success"],
+            "logseq.Editor.getPageBlocksTree": mock_logseq_responses["get_page_blocks_success"],
+            "logseq.Editor.getPageProperties": mock_logseq_responses["get_page_properties_success"],
+        })
+
+        async with client:
+            result = await client.get_page_content("Test Page")
+
+        assert result == {
+            "page": {
+                **mock_logseq_responses["get_page_success"],
+                "properties": mock_logseq_responses["get_page_properties_success"]
+            },
+            "blocks": mock_logseq_responses["get_page_blocks_success"]
+        }
+        assert sorted(call["method"] for call in calls) == [
+            "logseq.Editor.getPage",
+            "logseq.Editor.getPageBlocksTree",
+            "logseq.Editor.getPageProperties",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_page_content_not_found(self, mock_api_key):
+        """Test page content retrieval for non-existent page."""
+        client, _ = _mock_async_client(mock_api_key, {
+            "logseq.Editor.getPage": None,
+            "logseq.Editor.getPageBlocksTree": None,
+            "logseq.Editor.getPageProperties": None,
+        })
+
+        async with client:
+            assert await client.get_page_content("Missing") is None
+
+    @pytest.mark.asyncio
+    async def test_create_page_with_content(self, mock_api_key, mock_logseq_responses):
+        """Test page creation with content."""
+        client, calls = _mock_async_client(mock_api_key, {
+            "logseq.Editor.createPage": mock_logseq_responses["create_page_success"],
+            "logseq.Editor.appendBlockInPage": {"success": True},
+        })
+
+        async with client:
+            result = await client.create_page("Test Page", "Test content")
+
+        assert result == mock_logseq_responses["create_page_success"]
+        assert calls[1] == {
+            "method": "logseq.Editor.appendBlockInPage",
+            "args": ["Test Page", "Test content"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_replace_children(self, mock_api_key):
+        """Test that siblings keep their order while subtrees fill in."""
+        client, calls = _mock_async_client(mock_api_key, {
+            "logseq.Editor.getBlockChildrenTree": [{"uuid": "old-1"}, {"uuid": "old-2"}],
+            "logseq.Editor.removeBlock": None,
+            "logseq.Editor.insertBlock": lambda body: {"uuid": f"new-{body['args'][1]}"},
+        })
+
+        async with client:
+            inserted = await client.replace_children(
+                "parent-uuid",
+                [
+                    {"content": "A", "children": [{"content": "A1"}, {"content": "A2"}]},
+                    {"content": "B"},
+                ],
+            )
+
+        assert inserted == ["new-A", "new-B"]
+        deleted = {c["args"][0] for c in calls if c["method"] == "logseq.Editor.removeBlock"}
+        assert deleted == {"old-1", "old-2"}
+        inserts = [c["args"][:2] for c in calls if c["method"] == "logseq.Editor.insertBlock"]
+        roots = [args for args in inserts if args[0] == "parent-uuid"]
+        children = [args for args in inserts if args[0] == "new-A"]
+        assert roots == [["parent-uuid", "A"], ["parent-uuid", "B"]]
+        assert children == [["new-A", "A1"], ["new-A", "A2"]]
+
+    @pytest.mark.asyncio
+    async def test_replace_children_requires_content(self, mock_api_key):
+        """Test that block definitions without content are rejected."""
+        client, _ = _mock_async_client(mock_api_key, {})
+
+        async with client:
+            with pytest.raises(ValueError, match="must include a 'content' field"):
+                await client.replace_children("parent-uuid", [{"children": []}], delete_existing=False)
@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import patch, Mock
 from mcp.types import TextContent
@@ -7,7 +8,8 @@ from mcp_logseq.tools import (
     GetPageContentToolHandler,
     DeletePageToolHandler,
     UpdatePageToolHandler,
-    SearchToolHandler
+    SearchToolHandler,
+    _get_bool,
 )
 
 class TestCreatePageToolHandler:
@@ -22,6 +24,13 @@ class TestCreatePageToolHandler:
         assert "Create a new page in LogSeq" in tool.description
         assert tool.inputSchema["required"] == ["title", "content"]
 
+    def test_tool_description_is_cached(self):
+        """Test that the tool description is built once per handler."""
+        handler = CreatePageToolHandler()
+
+        assert handler.tool is handler.tool
+        assert handler.tool.name == "create_page"
+
     @patch.dict('os.environ', {'LOGSEQ_API_TOKEN': 'test_token'})
     @patch('mcp_logseq.tools.logseq.LogSeq')
     def test_run_tool_success(self, mock_logseq_class):
@@ -43,6 +52,17 @@ class TestCreatePageToolHandler:
         assert isinstance(result[0], TextContent)
         assert "Successfully created page 'Test Page'" in result[0].text
 
+    @patch('mcp_logseq.tools.logseq.LogSeq')
+    def test_run_tool_reuses_client(self, mock_logseq_class):
+        """Test that tool calls share one LogSeq client."""
+        handler = CreatePageToolHandler()
+
+        handler.run_tool({"title": "One", "content": ""})
+        handler.run_tool({"title": "Two", "content": ""})
+
+        mock_logseq_class.assert_called_once()
+        assert mock_logseq_class.return_value.create_page.call_count == 2
+
     @patch.dict('os.environ', {'LOGSEQ_API_TOKEN': 'test_token'})
     def test_run_tool_missing_args(self):
         """Test tool with missing required arguments."""
@@ -108,6 +128,7 @@ class TestListPagesToolHandler:
         assert "Journal Page" not in text
         assert "Total pages: 2" in text
         assert "(excluding journal pages)" in text
+        assert text.index("- Another Page") < text.index("- Regular Page")
 
     @patch.dict('os.environ', {'LOGSEQ_API_TOKEN': 'test_token'})
     @patch('mcp_logseq.tools.logseq.LogSeq')
@@ -189,7 +210,7 @@ class TestGetPageContentToolHandler:
         result = handler.run_tool({"page_name": "Test Page", "format": "json"})
         
         # Verify result
-        assert str(mock_data) in result[0].text
+        assert json.loads(result[0].text) == mock_data
 
     @patch.dict('os.environ', {'LOGSEQ_API_TOKEN': 'test_token'})
     @patch('mcp_logseq.tools.logseq.LogSeq')
@@ -353,6 +374,17 @@ class TestSearchToolHandler:
         assert "Matching Page" in text
         assert "Total results found: 2" in text
 
+    @patch('mcp_logseq.tools.logseq.LogSeq')
+    def test_run_tool_strips_snippet_highlights(self, mock_logseq_class):
+        """Test that search highlight markers are removed from snippets."""
+        mock_logseq_class.return_value.search_content.return_value = {
+            "pages-content": [{"block/snippet": "a $pfts_2lqh>$match$<pfts_2lqh$ here"}],
+        }
+
+        result = SearchToolHandler().run_tool({"query": "match"})
+
+        assert "1. a match here" in result[0].text
+
     @patch.dict('os.environ', {'LOGSEQ_API_TOKEN': 'test_token'})
     @patch('mcp_logseq.tools.logseq.LogSeq')
     def test_run_tool_no_results(self, mock_logseq_class):
@@ -387,4 +419,23 @@ class TestSearchToolHandler:
         })
         
         # Verify API was called with correct options
-        mock_api.search_content.assert_called_once_with("test", {"limit": 5})
\ No newline at end of file
+        mock_api.search_content.assert_called_once_with("test", {"limit": 5})
+
+
+
+class TestToolArgumentParsing:
+    """Test cases for shared tool argument helpers."""
+
+    @pytest.mark.parametrize("value,expected", [
+        (True, True),
+        (False, False),
+        (1, True),
+        (0, False),
+        ("true", True),
+        ("false", False),
+        (None, False),
+    ])
+    def test_get_bool(self, value, expected):
+        """Test boolean tool argument parsing."""
+        assert _get_bool({"flag": value}, "flag") is expected
+        assert _get_bool({}, "flag", True) is True